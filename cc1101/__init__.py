@@ -15,12 +15,15 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+# pylint: disable=too-many-lines
+
 from __future__ import annotations
 
 import contextlib
-import datetime
 import enum
 import fcntl
+import functools
+import itertools
 import logging
 import math
 import typing
@@ -28,7 +31,6 @@ import warnings
 
 import spidev
 
-import cc1101._gpio
 from cc1101.addresses import (
     ConfigurationRegisterAddress,
     FIFORegisterAddress,
@@ -44,8 +46,62 @@ from cc1101.options import (
     _TransceiveMode,
 )
 
+if typing.TYPE_CHECKING:
+    import datetime  # only referenced in postponed annotations
+
 _LOGGER = logging.getLogger(__name__)
 
+# > All transfers on the SPI interface are done
+# > most significant bit first.
+# > All transactions on the SPI interface start with
+# > a header byte containing a R/W bit, a access bit (B),
+# > and a 6-bit address (A5 - A0).
+# > [...]
+# > Table 45: SPI Address Space
+_WRITE_SINGLE_BYTE = 0x00
+# > Registers with consecutive addresses can be
+# > accessed in an efficient way by setting the
+# > burst bit (B) in the header byte. The address
+# > bits (A5 - A0) set the start address in an
+# > internal address counter. This counter is
+# > incremented by one each new byte [...]
+_WRITE_BURST = 0x40
+_READ_SINGLE_BYTE = 0x80
+_READ_BURST = 0xC0
+
+# Header bytes precomputed per address & access mode at import,
+# so the SPI helpers do not reassemble them on every transaction.
+_READ_SINGLE_HEADERS = {
+    address: address | _READ_SINGLE_BYTE
+    for address in itertools.chain(ConfigurationRegisterAddress, FIFORegisterAddress)
+}
+_READ_BURST_HEADERS = {
+    address: address | _READ_BURST
+    for address in itertools.chain(
+        ConfigurationRegisterAddress,
+        PatableAddress,
+        FIFORegisterAddress,
+        StatusRegisterAddress,
+    )
+}
+_WRITE_BURST_HEADERS = {
+    address: address | _WRITE_BURST
+    for address in itertools.chain(
+        ConfigurationRegisterAddress, PatableAddress, FIFORegisterAddress
+    )
+}
+_STROBE_HEADERS = {address: address | _WRITE_SINGLE_BYTE for address in StrobeAddress}
+
+# Value→member maps, probed instead of calling Enum.__call__
+# (several method hops per lookup) when decoding register contents.
+_CONFIGURATION_REGISTERS_BY_VALUE = {
+    int(address): address for address in ConfigurationRegisterAddress
+}
+_MODULATION_FORMATS_BY_VALUE = {int(f): f for f in ModulationFormat}
+_SYNC_MODES_BY_VALUE = {int(m): m for m in SyncMode}
+_PACKET_LENGTH_MODES_BY_VALUE = {int(m): m for m in PacketLengthMode}
+_TRANSCEIVE_MODES_BY_VALUE = {int(m): m for m in _TransceiveMode}
+
 
 class Pin(enum.Enum):
     GDO0 = "GDO0"
@@ -68,6 +124,10 @@ class MainRadioControlStateMachineState(enum.IntEnum):
     # TXFIFO_UNDERFLOW = 0x16
 
 
+# value→member map, same purpose as _MODULATION_FORMATS_BY_VALUE etc. above
+_MARCSTATES_BY_VALUE = {int(s): s for s in MainRadioControlStateMachineState}
+
+
 class _ReceivedPacket:  # unstable
     # "Table 31: Typical RSSI_offset Values"
     _RSSI_OFFSET_dB = 74
@@ -115,24 +175,6 @@ def _format_patable(settings: typing.Iterable[int], insert_spaces: bool) -> str:
 class CC1101:
     # pylint: disable=too-many-public-methods
 
-    # > All transfers on the SPI interface are done
-    # > most significant bit first.
-    # > All transactions on the SPI interface start with
-    # > a header byte containing a R/W bit, a access bit (B),
-    # > and a 6-bit address (A5 - A0).
-    # > [...]
-    # > Table 45: SPI Address Space
-    _WRITE_SINGLE_BYTE = 0x00
-    # > Registers with consecutive addresses can be
-    # > accessed in an efficient way by setting the
-    # > burst bit (B) in the header byte. The address
-    # > bits (A5 - A0) set the start address in an
-    # > internal address counter. This counter is
-    # > incremented by one each new byte [...]
-    _WRITE_BURST = 0x40
-    _READ_SINGLE_BYTE = 0x80
-    _READ_BURST = 0xC0
-
     # 29.3 Status Register Details
     _SUPPORTED_PARTNUM = 0
     # > The two versions of the chip will behave the same.
@@ -155,14 +197,28 @@ class CC1101:
     # > The PATABLE is an 8-byte table that defines the PA control settings [...]
     _PATABLE_LENGTH_BYTES = 8
 
+    # MDMCFG1.NUM_PREAMBLE, inverse of .get_preamble_length_bytes()
+    _PREAMBLE_LENGTH_TO_INDEX = {2: 0, 3: 1, 4: 2, 6: 3, 8: 4, 12: 5, 16: 6, 24: 7}
+
     def __init__(
         self,
         spi_bus: int = 0,
         spi_chip_select: int = 0,
         lock_spi_device: bool = False,
-        spi_max_speed_hz: int = 55700,
+        spi_max_speed_hz: int = 5000000,
     ) -> None:
         """
+        spi_max_speed_hz:
+            Clock frequency of the SPI bus in hertz.
+            > The SPI interface [...] operates up to 6.5 MHz
+            > when reading registers using burst access.
+            see "Table 22: SPI Interface Timing Requirements"
+            At the conservative 55700 Hz used by earlier releases,
+            clocking the bits of a full configuration dump alone
+            takes several milliseconds;
+            pass spi_max_speed_hz=55700 to restore the old behaviour
+            in case of transfer errors due to long or noisy wiring.
+
         lock_spi_device:
             When True, an advisory, exclusive lock will be set on the SPI device file
             non-blockingly via flock upon entering the context.
@@ -182,6 +238,9 @@ class CC1101:
         """
         self._spi = spidev.SpiDev()
         self._spi_max_speed_hz = spi_max_speed_hz
+        # Shadow copy of the configuration registers, keyed by address.
+        # Lets setters skip the read half of their read-modify-write cycles.
+        self._configuration_register_cache: typing.Dict[int, int] = {}
         self._spi_bus = int(spi_bus)
         # > The BCM2835 core common to all Raspberry Pi devices has 3 SPI Controllers:
         # > SPI0, with two hardware chip selects, [...]
@@ -205,6 +264,10 @@ class CC1101:
         # > the burst access bit (set to 0), and the six address bits [...]
         # > The R/W̄ bit can be either one or zero and will determine how the
         # > FIFO_BYTES_AVAILABLE field in the status byte should be interpreted.
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            # skip the bit decoding and format-string handling
+            # that every SPI transaction would otherwise pay
+            return
         _LOGGER.debug(
             "chip status byte: CHIP_RDYn=%d STATE=%s FIFO_BYTES_AVAILBLE=%d",
             chip_status >> 7,
@@ -215,8 +278,7 @@ class CC1101:
     def _read_single_byte(
         self, register: typing.Union[ConfigurationRegisterAddress, FIFORegisterAddress]
     ) -> int:
-        response = self._spi.xfer([register | self._READ_SINGLE_BYTE, 0])
-        assert len(response) == 2, response
+        response = self._spi.xfer2(bytearray((_READ_SINGLE_HEADERS[register], 0)))
         self._log_chip_status_byte(response[0])
         return response[1]
 
@@ -226,9 +288,10 @@ class CC1101:
             ConfigurationRegisterAddress, PatableAddress, FIFORegisterAddress
         ],
         length: int,
-    ) -> typing.List[int]:
-        response = self._spi.xfer([start_register | self._READ_BURST] + [0] * length)
-        assert len(response) == length + 1, response
+    ) -> bytes:
+        buffer = bytearray(length + 1)
+        buffer[0] = _READ_BURST_HEADERS[start_register]
+        response = bytes(self._spi.xfer2(buffer))
         self._log_chip_status_byte(response[0])
         return response[1:]
 
@@ -242,16 +305,19 @@ class CC1101:
         # > for status registers and they must be accessed
         # > one at a time. The status registers can only be
         # > read.
-        response = self._spi.xfer([register | self._READ_BURST, 0])
-        assert len(response) == 2, response
+        response = self._spi.xfer2(bytearray((_READ_BURST_HEADERS[register], 0)))
         self._log_chip_status_byte(response[0])
         return response[1]
 
     def _command_strobe(self, register: StrobeAddress) -> None:
         # see "10.4 Command Strobes"
+        if not _LOGGER.isEnabledFor(logging.DEBUG):
+            # the returned chip status byte only serves debug logging;
+            # a pure write avoids allocating a response list per strobe
+            self._spi.writebytes2(bytearray((_STROBE_HEADERS[register],)))
+            return
         _LOGGER.debug("sending command strobe 0x%02x", register)
-        response = self._spi.xfer([register | self._WRITE_SINGLE_BYTE])
-        assert len(response) == 1, response
+        response = self._spi.xfer2(bytearray((_STROBE_HEADERS[register],)))
         self._log_chip_status_byte(response[0])
 
     def _write_burst(
@@ -259,18 +325,89 @@ class CC1101:
         start_register: typing.Union[
             ConfigurationRegisterAddress, PatableAddress, FIFORegisterAddress
         ],
-        values: typing.List[int],
+        values: typing.Sequence[int],
     ) -> None:
-        _LOGGER.debug(
-            "writing burst: start_register=0x%02x values=%s", start_register, values
-        )
-        response = self._spi.xfer([start_register | self._WRITE_BURST] + values)
-        assert len(response) == len(values) + 1, response
-        self._log_chip_status_byte(response[0])
-        assert all(v == response[0] for v in response[1:]), response
+        buffer = bytearray(len(values) + 1)
+        buffer[0] = _WRITE_BURST_HEADERS[start_register]
+        buffer[1:] = bytearray(values)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "writing burst: start_register=0x%02x values=%s", start_register, values
+            )
+            response = self._spi.xfer2(buffer)
+            self._log_chip_status_byte(response[0])
+            # debug-only invariant; skips an O(len(values)) scan otherwise
+            assert all(v == response[0] for v in response[1:]), response
+        else:
+            # the returned chip status bytes only serve debug logging;
+            # a pure write avoids allocating a response list per burst
+            self._spi.writebytes2(buffer)
+        if start_register <= ConfigurationRegisterAddress.TEST0:  # not PATABLE or FIFO
+            for index, value in enumerate(values):
+                self._configuration_register_cache[start_register + index] = value
 
     def _reset(self) -> None:
         self._command_strobe(StrobeAddress.SRES)
+        self._configuration_register_cache.clear()
+
+    def _read_configuration_register(
+        self, register: ConfigurationRegisterAddress
+    ) -> int:
+        """
+        Returns the configuration register's last known value,
+        falling back to a single-byte read when it is not cached.
+
+        Every SPI transaction pays a millisecond-class round trip;
+        serving read-modify-write cycles from the cache halves
+        the number of transactions issued by setters.
+        """
+        try:
+            return self._configuration_register_cache[register]
+        except KeyError:
+            value = self._read_single_byte(register)
+            self._configuration_register_cache[register] = value
+            return value
+
+    def _prime_configuration_register_cache(self) -> None:
+        """
+        Fills the configuration register cache
+        with the chip's current values via a single burst read.
+
+        see ._read_configuration_register()
+        """
+        start_register = min(ConfigurationRegisterAddress)
+        values = self._read_burst(
+            start_register=start_register,
+            length=max(ConfigurationRegisterAddress) - start_register + 1,
+        )
+        self._configuration_register_cache = {
+            start_register + i: v for i, v in enumerate(values)
+        }
+
+    def _write_configuration_registers(
+        self, values: typing.Dict[ConfigurationRegisterAddress, int]
+    ) -> None:
+        """
+        Writes the given configuration registers in a single burst write.
+
+        The configuration registers are contiguous,
+        so gaps between the given registers are filled with cached values
+        and rewritten unchanged.
+        A single burst write avoids the chip-select overhead
+        of one SPI transaction per register.
+        """
+        assert values, values
+        start_register = min(values.keys())
+        image = [
+            values[address]
+            if address in values
+            else self._read_configuration_register(address)
+            for address in (
+                _CONFIGURATION_REGISTERS_BY_VALUE[register]
+                for register in range(start_register, max(values.keys()) + 1)
+            )
+        ]
+        self._write_burst(start_register=start_register, values=image)
 
     @classmethod
     def _filter_bandwidth_floating_point_to_real(
@@ -302,7 +439,9 @@ class CC1101:
         """
         MDMCFG4.CHANBW_E & MDMCFG4.CHANBW_M
         """
-        mdmcfg4 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG4)
+        mdmcfg4 = self._read_configuration_register(
+            ConfigurationRegisterAddress.MDMCFG4
+        )
         mdmcfg4 &= 0b00001111
         assert 0 <= exponent <= 0b11, exponent
         mdmcfg4 |= exponent << 6
@@ -319,7 +458,9 @@ class CC1101:
         return self._read_single_byte(ConfigurationRegisterAddress.MDMCFG4) & 0b00001111
 
     def _set_symbol_rate_exponent(self, exponent: int):
-        mdmcfg4 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG4)
+        mdmcfg4 = self._read_configuration_register(
+            ConfigurationRegisterAddress.MDMCFG4
+        )
         mdmcfg4 &= 0b11110000
         mdmcfg4 |= exponent
         self._write_burst(
@@ -349,15 +490,17 @@ class CC1101:
             / (2**28)
         )
 
-    @classmethod
-    def _symbol_rate_real_to_floating_point(cls, real: float) -> typing.Tuple[int, int]:
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _symbol_rate_real_to_floating_point(real: float) -> typing.Tuple[int, int]:
         # see "12 Data Rate Programming"
+        # cached because tuning loops repeatedly request the same rates
         assert real > 0, real
         exponent = math.floor(
-            math.log2(real / cls._CRYSTAL_OSCILLATOR_FREQUENCY_HERTZ) + 20
+            math.log2(real / CC1101._CRYSTAL_OSCILLATOR_FREQUENCY_HERTZ) + 20
         )
         mantissa = round(
-            real * 2**28 / cls._CRYSTAL_OSCILLATOR_FREQUENCY_HERTZ / 2**exponent
+            real * 2**28 / CC1101._CRYSTAL_OSCILLATOR_FREQUENCY_HERTZ / 2**exponent
             - 256
         )
         if mantissa == 256:
@@ -381,10 +524,16 @@ class CC1101:
 
     def get_modulation_format(self) -> ModulationFormat:
         mdmcfg2 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG2)
-        return ModulationFormat((mdmcfg2 >> 4) & 0b111)
+        try:
+            return _MODULATION_FORMATS_BY_VALUE[(mdmcfg2 >> 4) & 0b111]
+        except KeyError:
+            # raises a descriptive ValueError for the reserved settings
+            return ModulationFormat((mdmcfg2 >> 4) & 0b111)
 
     def _set_modulation_format(self, modulation_format: ModulationFormat) -> None:
-        mdmcfg2 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG2)
+        mdmcfg2 = self._read_configuration_register(
+            ConfigurationRegisterAddress.MDMCFG2
+        )
         mdmcfg2 &= 0b10001111
         mdmcfg2 |= modulation_format << 4
         self._write_burst(ConfigurationRegisterAddress.MDMCFG2, [mdmcfg2])
@@ -396,13 +545,15 @@ class CC1101:
         Enable manchester encoding & decoding for the entire packet,
         including the preamble and synchronization word.
         """
-        mdmcfg2 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG2)
+        mdmcfg2 = self._read_configuration_register(
+            ConfigurationRegisterAddress.MDMCFG2
+        )
         mdmcfg2 |= 0b1000
         self._write_burst(ConfigurationRegisterAddress.MDMCFG2, [mdmcfg2])
 
     def get_sync_mode(self) -> SyncMode:
         mdmcfg2 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG2)
-        return SyncMode(mdmcfg2 & 0b11)
+        return _SYNC_MODES_BY_VALUE[mdmcfg2 & 0b11]
 
     def set_sync_mode(
         self,
@@ -423,7 +574,9 @@ class CC1101:
         True: enable, False: disable, None: keep current setting
         See "17.4 Carrier Sense (CS)"
         """
-        mdmcfg2 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG2)
+        mdmcfg2 = self._read_configuration_register(
+            ConfigurationRegisterAddress.MDMCFG2
+        )
         mdmcfg2 &= 0b11111100
         mdmcfg2 |= mode
         if _carrier_sense_threshold_enabled is not None:
@@ -448,7 +601,9 @@ class CC1101:
 
     def _set_preamble_length_index(self, index: int) -> None:
         assert 0 <= index <= 0b111
-        mdmcfg1 = self._read_single_byte(ConfigurationRegisterAddress.MDMCFG1)
+        mdmcfg1 = self._read_configuration_register(
+            ConfigurationRegisterAddress.MDMCFG1
+        )
         mdmcfg1 &= 0b10001111
         mdmcfg1 |= index << 4
         self._write_burst(ConfigurationRegisterAddress.MDMCFG1, [mdmcfg1])
@@ -463,16 +618,14 @@ class CC1101:
                 "\ncall .set_sync_mode(cc1101.SyncMode.NO_PREAMBLE_AND_SYNC_WORD)"
                 " to disable preamble"
             )
-        if length % 3 == 0:  # pylint: disable=consider-ternary-expression
-            index = math.log2(length / 3) * 2 + 1
-        else:
-            index = math.log2(length / 2) * 2
-        if not index.is_integer() or index < 0 or index > 0b111:
+        try:
+            index = self._PREAMBLE_LENGTH_TO_INDEX[length]
+        except KeyError:
             raise ValueError(
                 f"unsupported preamble length: {length} bytes"
                 "\nsee MDMCFG1.NUM_PREAMBLE in cc1101 docs"
-            )
-        self._set_preamble_length_index(int(index))
+            ) from None
+        self._set_preamble_length_index(index)
 
     def _get_power_amplifier_setting_index(self) -> int:
         """
@@ -499,18 +652,30 @@ class CC1101:
         > shall be programmed to index 0 and 1 respectively.
         """
         assert 0 <= setting_index <= 0b111, setting_index
-        frend0 = self._read_single_byte(ConfigurationRegisterAddress.FREND0)
+        frend0 = self._read_configuration_register(ConfigurationRegisterAddress.FREND0)
         frend0 &= 0b11111000
         frend0 |= setting_index
         self._write_burst(ConfigurationRegisterAddress.FREND0, [frend0])
 
+    def _read_partnum_version(self) -> typing.Tuple[int, int]:
+        """
+        Reads the PARTNUM & VERSION status registers.
+
+        Status registers "must be accessed one at a time"
+        (see ._read_status_register),
+        so this takes two separate SPI transactions.
+        """
+        return (
+            self._read_status_register(StatusRegisterAddress.PARTNUM),
+            self._read_status_register(StatusRegisterAddress.VERSION),
+        )
+
     def _verify_chip(self) -> None:
-        partnum = self._read_status_register(StatusRegisterAddress.PARTNUM)
+        partnum, version = self._read_partnum_version()
         if partnum != self._SUPPORTED_PARTNUM:
             raise ValueError(
                 f"unexpected chip part number {partnum} (expected: {self._SUPPORTED_PARTNUM})"
             )
-        version = self._read_status_register(StatusRegisterAddress.VERSION)
         if version not in self._SUPPORTED_VERSIONS:
             msg = f"Unsupported chip version 0x{version:02x}"
             supported_versions = ", ".join(
@@ -526,25 +691,40 @@ class CC1101:
             raise ValueError(msg)
 
     def _configure_defaults(self) -> None:
+        self._prime_configuration_register_cache()
         # next major/breaking release will probably stick closer to CC1101's defaults
-        # 6:4 MOD_FORMAT: OOK (default: 2-FSK)
-        self._set_modulation_format(ModulationFormat.ASK_OOK)
-        self._set_power_amplifier_setting_index(1)
-        self._disable_data_whitening()
-        # 7:6 unused
-        # 5:4 FS_AUTOCAL: calibrate when going from IDLE to RX or TX
-        # 3:2 PO_TIMEOUT: default
-        # 1 PIN_CTRL_EN: default
-        # 0 XOSC_FORCE_ON: default
-        self._write_burst(ConfigurationRegisterAddress.MCSM0, [0b010100])
+        defaults: typing.Dict[ConfigurationRegisterAddress, int] = {}
         # > Default is CLK_XOSC/192 (See Table 41 on page 62).
         # > It is recommended to disable the clock output in initialization,
         # > in order to optimize RF performance.
-        self._write_burst(
-            ConfigurationRegisterAddress.IOCFG0,
+        defaults[ConfigurationRegisterAddress.IOCFG0] = (
             # required for _wait_for_packet()
-            [GDOSignalSelection.RX_FIFO_AT_OR_ABOVE_THRESHOLD_OR_PACKET_END_REACHED],
+            GDOSignalSelection.RX_FIFO_AT_OR_ABOVE_THRESHOLD_OR_PACKET_END_REACHED
         )
+        # PKTCTRL0.WHITE_DATA, see ._disable_data_whitening()
+        defaults[ConfigurationRegisterAddress.PKTCTRL0] = (
+            self._read_configuration_register(ConfigurationRegisterAddress.PKTCTRL0)
+            & 0b10111111
+        )
+        # 6:4 MOD_FORMAT: OOK (default: 2-FSK), see ._set_modulation_format()
+        defaults[ConfigurationRegisterAddress.MDMCFG2] = (
+            self._read_configuration_register(ConfigurationRegisterAddress.MDMCFG2)
+            & 0b10001111
+        ) | (ModulationFormat.ASK_OOK << 4)
+        # 7:6 unused
+        # 5:4 FS_AUTOCAL: calibrate when going from IDLE to RX or TX
+        # 3:2 PO_TIMEOUT: default
+        # 1 PIN_CTRL_EN: default
+        # 0 XOSC_FORCE_ON: default
+        defaults[ConfigurationRegisterAddress.MCSM0] = 0b010100
+        # FREND0.PA_POWER, see ._set_power_amplifier_setting_index()
+        defaults[ConfigurationRegisterAddress.FREND0] = (
+            self._read_configuration_register(ConfigurationRegisterAddress.FREND0)
+            & 0b11111000
+        ) | 1
+        # single burst write covering IOCFG0..FREND0
+        # instead of one transaction per register
+        self._write_configuration_registers(defaults)
 
     def __enter__(self) -> CC1101:
         # https://docs.python.org/3/reference/datamodel.html#object.__enter__
@@ -606,9 +786,13 @@ class CC1101:
     def get_main_radio_control_state_machine_state(
         self,
     ) -> MainRadioControlStateMachineState:
-        return MainRadioControlStateMachineState(
-            self._read_status_register(StatusRegisterAddress.MARCSTATE)
-        )
+        marcstate = self._read_status_register(StatusRegisterAddress.MARCSTATE)
+        try:
+            return _MARCSTATES_BY_VALUE[marcstate]
+        except KeyError:
+            # MainRadioControlStateMachineState does not list
+            # all transient states; raises a descriptive ValueError
+            return MainRadioControlStateMachineState(marcstate)
 
     def get_marc_state(self) -> MainRadioControlStateMachineState:
         """
@@ -617,28 +801,31 @@ class CC1101:
         return self.get_main_radio_control_state_machine_state()
 
     @classmethod
-    def _frequency_control_word_to_hertz(cls, control_word: typing.List[int]) -> float:
+    def _frequency_control_word_to_hertz(
+        cls, control_word: typing.Sequence[int]
+    ) -> float:
+        # unrolled int.from_bytes; faster for three bytes
+        # than the generic conversion and accepts bytes & lists alike
         return (
-            int.from_bytes(control_word, byteorder="big", signed=False)
+            ((control_word[0] << 16) | (control_word[1] << 8) | control_word[2])
             * cls._FREQUENCY_CONTROL_WORD_HERTZ_FACTOR
         )
 
-    @classmethod
-    def _hertz_to_frequency_control_word(cls, hertz: float) -> typing.List[int]:
-        return list(
-            round(hertz / cls._FREQUENCY_CONTROL_WORD_HERTZ_FACTOR).to_bytes(
-                length=3, byteorder="big", signed=False
-            )
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _hertz_to_frequency_control_word(hertz: float) -> bytes:
+        return round(hertz / CC1101._FREQUENCY_CONTROL_WORD_HERTZ_FACTOR).to_bytes(
+            length=3, byteorder="big", signed=False
         )
 
-    def _get_base_frequency_control_word(self) -> typing.List[int]:
+    def _get_base_frequency_control_word(self) -> bytes:
         # > The base or start frequency is set by the 24 bitfrequency
         # > word located in the FREQ2, FREQ1, FREQ0 registers.
         return self._read_burst(
             start_register=ConfigurationRegisterAddress.FREQ2, length=3
         )
 
-    def _set_base_frequency_control_word(self, control_word: typing.List[int]) -> None:
+    def _set_base_frequency_control_word(self, control_word: bytes) -> None:
         self._write_burst(
             start_register=ConfigurationRegisterAddress.FREQ2, values=control_word
         )
@@ -648,8 +835,9 @@ class CC1101:
             self._get_base_frequency_control_word()
         )
 
-    def set_base_frequency_hertz(self, freq: float) -> None:
-        if freq < (self._TRANSMIT_MIN_FREQUENCY_HERTZ - 50e3):
+    @classmethod
+    def _warn_on_low_base_frequency(cls, freq: float) -> None:
+        if freq < (cls._TRANSMIT_MIN_FREQUENCY_HERTZ - 50e3):
             # > [use] warnings.warn() in library code if the issue is avoidable
             # > and the client application should be modified to eliminate the warning[.]
             # > [use] logging.warning() if there is nothing the client application
@@ -657,34 +845,135 @@ class CC1101:
             # https://docs.python.org/3/howto/logging.html#when-to-use-logging
             warnings.warn(
                 "CC1101 is unable to transmit at frequencies"
-                f" below {(self._TRANSMIT_MIN_FREQUENCY_HERTZ / 1e6):.1f} MHz"
+                f" below {(cls._TRANSMIT_MIN_FREQUENCY_HERTZ / 1e6):.1f} MHz"
             )
+
+    def set_base_frequency_hertz(self, freq: float) -> None:
+        self._warn_on_low_base_frequency(freq)
         self._set_base_frequency_control_word(
             self._hertz_to_frequency_control_word(freq)
         )
 
+    def configure(  # pylint: disable=too-many-arguments; all keyword-only
+        self,
+        *,
+        base_frequency_hertz: typing.Optional[float] = None,
+        symbol_rate_baud: typing.Optional[float] = None,
+        sync_mode: typing.Optional[SyncMode] = None,
+        sync_word: typing.Optional[bytes] = None,
+        packet_length_mode: typing.Optional[PacketLengthMode] = None,
+        packet_length_bytes: typing.Optional[int] = None,
+    ) -> None:
+        """
+        Applies the given settings with a single burst write,
+        instead of one SPI transaction per call to the individual setters.
+        Settings left at None keep their current value.
+
+        >>> with cc1101.CC1101() as transceiver:
+        >>>     transceiver.configure(
+        >>>         base_frequency_hertz=433.92e6,
+        >>>         symbol_rate_baud=600,
+        >>>         packet_length_mode=cc1101.PacketLengthMode.FIXED,
+        >>>         packet_length_bytes=4,
+        >>>     )
+
+        see .set_base_frequency_hertz(), .set_symbol_rate_baud(),
+        .set_sync_mode(), .set_sync_word(),
+        .set_packet_length_mode() & .set_packet_length_bytes()
+        """
+        changes: typing.Dict[ConfigurationRegisterAddress, int] = {}
+        if base_frequency_hertz is not None:
+            self._warn_on_low_base_frequency(base_frequency_hertz)
+            control_word = self._hertz_to_frequency_control_word(base_frequency_hertz)
+            changes[ConfigurationRegisterAddress.FREQ2] = control_word[0]
+            changes[ConfigurationRegisterAddress.FREQ1] = control_word[1]
+            changes[ConfigurationRegisterAddress.FREQ0] = control_word[2]
+        if symbol_rate_baud is not None:
+            mantissa, exponent = self._symbol_rate_real_to_floating_point(
+                symbol_rate_baud
+            )
+            changes[ConfigurationRegisterAddress.MDMCFG4] = (
+                self._read_configuration_register(ConfigurationRegisterAddress.MDMCFG4)
+                & 0b11110000
+            ) | exponent
+            changes[ConfigurationRegisterAddress.MDMCFG3] = mantissa
+        if sync_mode is not None:
+            changes[ConfigurationRegisterAddress.MDMCFG2] = (
+                self._read_configuration_register(ConfigurationRegisterAddress.MDMCFG2)
+                & 0b11111100
+            ) | sync_mode
+        if sync_word is not None:
+            if len(sync_word) != 2:
+                raise ValueError(f"expected two bytes, got {sync_word!r}")
+            changes[ConfigurationRegisterAddress.SYNC1] = sync_word[0]
+            changes[ConfigurationRegisterAddress.SYNC0] = sync_word[1]
+        if packet_length_mode is not None:
+            changes[ConfigurationRegisterAddress.PKTCTRL0] = (
+                self._read_configuration_register(ConfigurationRegisterAddress.PKTCTRL0)
+                & 0b11111100
+            ) | packet_length_mode
+        if packet_length_bytes is not None:
+            assert (
+                1 <= packet_length_bytes <= 255
+            ), f"unsupported packet length {packet_length_bytes}"
+            changes[ConfigurationRegisterAddress.PKTLEN] = packet_length_bytes
+        if changes:
+            self._write_configuration_registers(changes)
+
     def __str__(self) -> str:
-        sync_mode = self.get_sync_mode()
+        # one burst read covering all involved configuration registers
+        # instead of one SPI transaction per attribute
+        config = self.get_configuration_register_values(
+            start_register=ConfigurationRegisterAddress.SYNC1,
+            end_register=ConfigurationRegisterAddress.FREND0,
+        )
+        base_frequency_hertz = self._frequency_control_word_to_hertz(
+            [
+                config[ConfigurationRegisterAddress.FREQ2],
+                config[ConfigurationRegisterAddress.FREQ1],
+                config[ConfigurationRegisterAddress.FREQ0],
+            ]
+        )
+        symbol_rate_baud = self._symbol_rate_floating_point_to_real(
+            mantissa=config[ConfigurationRegisterAddress.MDMCFG3],
+            exponent=config[ConfigurationRegisterAddress.MDMCFG4] & 0b00001111,
+        )
+        mdmcfg2 = config[ConfigurationRegisterAddress.MDMCFG2]
+        sync_mode = _SYNC_MODES_BY_VALUE[mdmcfg2 & 0b11]
+        preamble_length_index = (
+            config[ConfigurationRegisterAddress.MDMCFG1] >> 4
+        ) & 0b111
+        sync_word = bytes(
+            (
+                config[ConfigurationRegisterAddress.SYNC1],
+                config[ConfigurationRegisterAddress.SYNC0],
+            )
+        )
+        pktctrl0 = config[ConfigurationRegisterAddress.PKTCTRL0]
+        output_power = self._get_patable()[
+            : (config[ConfigurationRegisterAddress.FREND0] & 0b111) + 1
+        ]
         attrs = (
             f"marcstate={self.get_main_radio_control_state_machine_state().name.lower()}",
-            f"base_frequency={(self.get_base_frequency_hertz() / 1e6):.2f}MHz",
-            f"symbol_rate={(self.get_symbol_rate_baud() / 1000):.2f}kBaud",
-            f"modulation_format={self.get_modulation_format().name}",
+            f"base_frequency={(base_frequency_hertz / 1e6):.2f}MHz",
+            f"symbol_rate={(symbol_rate_baud / 1000):.2f}kBaud",
+            f"modulation_format={ModulationFormat((mdmcfg2 >> 4) & 0b111).name}",
             f"sync_mode={sync_mode.name}",
-            f"preamble_length={self.get_preamble_length_bytes()}B"
+            "preamble_length={}B".format(  # pylint: disable=consider-using-f-string
+                2 ** (preamble_length_index >> 1) * (2 + (preamble_length_index & 0b1))
+            )
             if sync_mode != SyncMode.NO_PREAMBLE_AND_SYNC_WORD
             else None,
-            f"sync_word=0x{self.get_sync_word().hex()}"
+            f"sync_word=0x{sync_word.hex()}"
             if sync_mode != SyncMode.NO_PREAMBLE_AND_SYNC_WORD
             else None,
             "packet_length{}{}B".format(  # pylint: disable=consider-using-f-string
                 "≤"
-                if self.get_packet_length_mode() == PacketLengthMode.VARIABLE
+                if PacketLengthMode(pktctrl0 & 0b11) == PacketLengthMode.VARIABLE
                 else "=",
-                self.get_packet_length_bytes(),
+                config[ConfigurationRegisterAddress.PKTLEN],
             ),
-            "output_power="
-            + _format_patable(self.get_output_power(), insert_spaces=False),
+            "output_power=" + _format_patable(output_power, insert_spaces=False),
         )
         # pylint: disable=consider-using-f-string
         return "CC1101({})".format(", ".join(filter(None, attrs)))
@@ -701,7 +990,7 @@ class CC1101:
             start_register=start_register, length=end_register - start_register + 1
         )
         return {
-            ConfigurationRegisterAddress(start_register + i): v
+            _CONFIGURATION_REGISTERS_BY_VALUE[start_register + i]: v
             for i, v in enumerate(values)
         }
 
@@ -726,7 +1015,7 @@ class CC1101:
         if len(sync_word) != 2:
             raise ValueError(f"expected two bytes, got {sync_word!r}")
         self._write_burst(
-            start_register=ConfigurationRegisterAddress.SYNC1, values=list(sync_word)
+            start_register=ConfigurationRegisterAddress.SYNC1, values=sync_word
         )
 
     def get_packet_length_bytes(self) -> int:
@@ -762,7 +1051,9 @@ class CC1101:
         > will be XOR-ed with a 9-bit pseudo-random (PN9)
         > sequence before being transmitted.
         """
-        pktctrl0 = self._read_single_byte(ConfigurationRegisterAddress.PKTCTRL0)
+        pktctrl0 = self._read_configuration_register(
+            ConfigurationRegisterAddress.PKTCTRL0
+        )
         pktctrl0 &= 0b10111111
         self._write_burst(
             start_register=ConfigurationRegisterAddress.PKTCTRL0, values=[pktctrl0]
@@ -777,7 +1068,9 @@ class CC1101:
 
         See "Figure 19: Packet Format".
         """
-        pktctrl0 = self._read_single_byte(ConfigurationRegisterAddress.PKTCTRL0)
+        pktctrl0 = self._read_configuration_register(
+            ConfigurationRegisterAddress.PKTCTRL0
+        )
         pktctrl0 &= 0b11111011
         self._write_burst(
             start_register=ConfigurationRegisterAddress.PKTCTRL0, values=[pktctrl0]
@@ -785,11 +1078,13 @@ class CC1101:
 
     def _get_transceive_mode(self) -> _TransceiveMode:
         pktctrl0 = self._read_single_byte(ConfigurationRegisterAddress.PKTCTRL0)
-        return _TransceiveMode((pktctrl0 >> 4) & 0b11)
+        return _TRANSCEIVE_MODES_BY_VALUE[(pktctrl0 >> 4) & 0b11]
 
     def _set_transceive_mode(self, mode: _TransceiveMode) -> None:
         _LOGGER.info("changing transceive mode to %s", mode.name)
-        pktctrl0 = self._read_single_byte(ConfigurationRegisterAddress.PKTCTRL0)
+        pktctrl0 = self._read_configuration_register(
+            ConfigurationRegisterAddress.PKTCTRL0
+        )
         pktctrl0 &= ~0b00110000
         pktctrl0 |= mode << 4
         self._write_burst(
@@ -798,10 +1093,16 @@ class CC1101:
 
     def get_packet_length_mode(self) -> PacketLengthMode:
         pktctrl0 = self._read_single_byte(ConfigurationRegisterAddress.PKTCTRL0)
-        return PacketLengthMode(pktctrl0 & 0b11)
+        try:
+            return _PACKET_LENGTH_MODES_BY_VALUE[pktctrl0 & 0b11]
+        except KeyError:
+            # raises a descriptive ValueError, e.g. for infinite mode
+            return PacketLengthMode(pktctrl0 & 0b11)
 
     def set_packet_length_mode(self, mode: PacketLengthMode) -> None:
-        pktctrl0 = self._read_single_byte(ConfigurationRegisterAddress.PKTCTRL0)
+        pktctrl0 = self._read_configuration_register(
+            ConfigurationRegisterAddress.PKTCTRL0
+        )
         pktctrl0 &= 0b11111100
         pktctrl0 |= mode
         self._write_burst(
@@ -907,9 +1208,20 @@ class CC1101:
             raise RuntimeError(
                 f"device must be idle before transmission (current marcstate: {marcstate.name})"
             )
-        self._flush_tx_fifo_buffer()
-        self._write_burst(FIFORegisterAddress.TX, list(payload))
-        _LOGGER.info("transmitting 0x%s (%r)", payload.hex(), payload)
+        if _LOGGER.isEnabledFor(logging.INFO):
+            # skip the hex conversion of the payload unless it gets logged
+            _LOGGER.info("transmitting 0x%s (%r)", payload.hex(), payload)
+        # > a command strobe may be followed by any other SPI access
+        # > without pulling CSn high.
+        # fusing the flush strobe & the FIFO write into one SPI message
+        # saves a chip-select cycle per packet;
+        # the STX strobe must follow in a separate message, as the burst
+        # write only terminates when chip select is deasserted
+        buffer = bytearray(len(payload) + 2)
+        buffer[0] = _STROBE_HEADERS[StrobeAddress.SFTX]
+        buffer[1] = _WRITE_BURST_HEADERS[FIFORegisterAddress.TX]
+        buffer[2:] = bytearray(payload)
+        self._spi.writebytes2(buffer)
         self._command_strobe(StrobeAddress.STX)
 
     @contextlib.contextmanager
@@ -964,6 +1276,9 @@ class CC1101:
         depends on IOCFG0 == 0b00000001 (see _configure_defaults)
         """
         # pylint: disable=protected-access
+        # postponed to avoid loading ctypes on import for transmit-only use
+        import cc1101._gpio  # pylint: disable=import-outside-toplevel
+
         gdo0 = cc1101._gpio.GPIOLine.find(name=gdo0_gpio_line_name)
         self._enable_receive_mode()
         if not gdo0.wait_for_rising_edge(consumer=b"CC1101:GDO0", timeout=timeout):
@@ -25,15 +25,17 @@ import pytest
     [([64, 211, 145], b"\xd3\x91"), ([64, 0, 0], b"\0\0")],
 )
 def test_get_sync_word(transceiver, xfer_return_value, sync_word):
-    transceiver._spi.xfer.return_value = xfer_return_value
+    transceiver._spi.xfer2.return_value = xfer_return_value
     assert transceiver.get_sync_word() == sync_word
-    transceiver._spi.xfer.assert_called_once_with([0x04 | 0xC0, 0, 0])
+    transceiver._spi.xfer2.assert_called_once_with(bytearray([0x04 | 0xC0, 0, 0]))
 
 
 def test_set_sync_word(transceiver):
-    transceiver._spi.xfer.return_value = [15, 15, 15]
+    transceiver._spi.xfer2.return_value = [15, 15, 15]
     transceiver.set_sync_word(b"\x12\x34")
-    transceiver._spi.xfer.assert_called_once_with([0x04 | 0x40, 0x12, 0x34])
+    transceiver._spi.writebytes2.assert_called_once_with(
+        bytearray([0x04 | 0x40, 0x12, 0x34])
+    )
 
 
 @pytest.mark.parametrize("sync_word", [b"", b"\0", "\x12\x34\x56"])
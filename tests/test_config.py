@@ -45,7 +45,7 @@ def test__frequency_control_word_to_hertz(control_word, hertz):
     ("control_word", "hertz"), _FREQUENCY_CONTROL_WORD_HERTZ_PARAMS
 )
 def test__hertz_to_frequency_control_word(control_word, hertz):
-    assert cc1101.CC1101._hertz_to_frequency_control_word(hertz) == control_word
+    assert cc1101.CC1101._hertz_to_frequency_control_word(hertz) == bytes(control_word)
 
 
 _FILTER_BANDWIDTH_MANTISSA_EXPONENT_REAL_PARAMS = [
@@ -0,0 +1,121 @@
+# python-cc1101 - Python Library to Transmit RF Signals via CC1101 Transceivers
+#
+# Copyright (C) 2020 Fabian Peter Hammerle <fabian@hammerle.me>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest.mock
+import warnings
+
+import pytest
+
+import cc1101
+
+# pylint: disable=protected-access
+
+
+def test_configure_noop(transceiver):
+    with unittest.mock.patch.object(transceiver, "_write_burst") as write_burst_mock:
+        transceiver.configure()
+    write_burst_mock.assert_not_called()
+
+
+def test_configure_sync_word(transceiver):
+    with unittest.mock.patch.object(transceiver, "_write_burst") as write_burst_mock:
+        transceiver.configure(sync_word=b"\x12\x34")
+    write_burst_mock.assert_called_once_with(start_register=0x04, values=[0x12, 0x34])
+
+
+def test_configure_packet_length(transceiver):
+    transceiver._configuration_register_cache.update(
+        {0x07: 0b00000100, 0x08: 0b01000101}
+    )
+    with unittest.mock.patch.object(transceiver, "_write_burst") as write_burst_mock:
+        transceiver.configure(
+            packet_length_mode=cc1101.PacketLengthMode.FIXED, packet_length_bytes=21
+        )
+    write_burst_mock.assert_called_once_with(
+        start_register=0x06, values=[21, 0b00000100, 0b01000100]
+    )
+
+
+def test_configure_multiple(transceiver):
+    # chip defaults for the touched & gap registers
+    transceiver._configuration_register_cache.update(
+        {
+            0x06: 0xFF,  # PKTLEN
+            0x07: 0b00000100,  # PKTCTRL1
+            0x08: 0b01000101,  # PKTCTRL0
+            0x09: 0,  # ADDR
+            0x0A: 0,  # CHANNR
+            0x0B: 0x0F,  # FSCTRL1
+            0x0C: 0,  # FSCTRL0
+            0x10: 0b10001100,  # MDMCFG4
+        }
+    )
+    with unittest.mock.patch.object(transceiver, "_write_burst") as write_burst_mock:
+        transceiver.configure(
+            base_frequency_hertz=433.92e6,
+            symbol_rate_baud=600,
+            sync_word=b"\x01\xef",
+            packet_length_mode=cc1101.PacketLengthMode.VARIABLE,
+        )
+    frequency_control_word = cc1101.CC1101._hertz_to_frequency_control_word(433.92e6)
+    mantissa, exponent = cc1101.CC1101._symbol_rate_real_to_floating_point(600)
+    write_burst_mock.assert_called_once_with(
+        start_register=0x04,
+        values=[
+            0x01,  # SYNC1
+            0xEF,  # SYNC0
+            0xFF,  # PKTLEN (cached)
+            0b00000100,  # PKTCTRL1 (cached)
+            0b01000101,  # PKTCTRL0: VARIABLE
+            0,  # ADDR (cached)
+            0,  # CHANNR (cached)
+            0x0F,  # FSCTRL1 (cached)
+            0,  # FSCTRL0 (cached)
+            frequency_control_word[0],  # FREQ2
+            frequency_control_word[1],  # FREQ1
+            frequency_control_word[2],  # FREQ0
+            0b10000000 | exponent,  # MDMCFG4
+            mantissa,  # MDMCFG3
+        ],
+    )
+
+
+def test_configure_low_base_frequency_warning(transceiver):
+    with unittest.mock.patch.object(transceiver, "_write_burst"):
+        with warnings.catch_warnings(record=True) as caught_warnings:
+            transceiver.configure(base_frequency_hertz=100e6)
+    assert len(caught_warnings) == 1
+    assert (
+        str(caught_warnings[0].message)
+        == "CC1101 is unable to transmit at frequencies below 281.7 MHz"
+    )
+
+
+@pytest.mark.parametrize("sync_word", (b"", b"\x12", b"\x12\x34\x56"))
+def test_configure_invalid_sync_word(transceiver, sync_word):
+    with pytest.raises(ValueError, match=r"^expected two bytes"):
+        transceiver.configure(sync_word=sync_word)
+    transceiver._spi.xfer2.assert_not_called()
+    transceiver._spi.writebytes2.assert_not_called()
+
+
+@pytest.mark.parametrize("packet_length_bytes", (-21, 0, 256))
+def test_configure_invalid_packet_length(transceiver, packet_length_bytes):
+    with pytest.raises(Exception):
+        transceiver.configure(packet_length_bytes=packet_length_bytes)
+    transceiver._spi.xfer2.assert_not_called()
+    transceiver._spi.writebytes2.assert_not_called()
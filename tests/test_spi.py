@@ -35,7 +35,7 @@ def test___init__select_device(bus, chip_select):
     assert transceiver._spi_bus == bus
     assert transceiver._spi_chip_select == chip_select
     assert transceiver._spi_device_path == f"/dev/spidev{bus}.{chip_select}"
-    assert transceiver._spi_max_speed_hz == 55700
+    assert transceiver._spi_max_speed_hz == 5000000
     transceiver._spi.open.side_effect = SystemExit
     with pytest.raises(SystemExit):
         with transceiver:
@@ -44,60 +44,154 @@ def test___init__select_device(bus, chip_select):
 
 
 def test__read_status_register(transceiver):
-    transceiver._spi.xfer.return_value = [0, 20]
+    transceiver._spi.xfer2.return_value = [0, 20]
     transceiver._read_status_register(cc1101.addresses.StatusRegisterAddress.VERSION)
-    transceiver._spi.xfer.assert_called_once_with([0x31 | 0xC0, 0])
+    transceiver._spi.xfer2.assert_called_once_with(bytearray([0x31 | 0xC0, 0]))
 
 
 def test__command_strobe(transceiver):
-    transceiver._spi.xfer.return_value = [15]
+    transceiver._spi.xfer2.return_value = [15]
     transceiver._command_strobe(cc1101.addresses.StrobeAddress.STX)
-    transceiver._spi.xfer.assert_called_once_with([0x35 | 0x00])
+    transceiver._spi.writebytes2.assert_called_once_with(bytearray([0x35 | 0x00]))
+
+
+def test__read_partnum_version(transceiver):
+    transceiver._spi.xfer2.side_effect = [[15, 0], [15, 0x14]]
+    assert transceiver._read_partnum_version() == (0, 0x14)
+    assert transceiver._spi.xfer2.call_args_list == [
+        unittest.mock.call(bytearray([0x30 | 0xC0, 0])),
+        unittest.mock.call(bytearray([0x31 | 0xC0, 0])),
+    ]
+
+
+def test__read_burst(transceiver):
+    transceiver._spi.xfer2.return_value = [15, 0x0A, 0x0B, 0x0C]
+    response = transceiver._read_burst(
+        start_register=cc1101.addresses.ConfigurationRegisterAddress.FREQ2, length=3
+    )
+    assert response == b"\x0a\x0b\x0c"
+    transceiver._spi.xfer2.assert_called_once_with(bytearray([0x0D | 0xC0, 0, 0, 0]))
 
 
 def test__reset(transceiver):
-    transceiver._spi.xfer.return_value = [15]
+    transceiver._spi.xfer2.return_value = [15]
+    transceiver._reset()
+    transceiver._spi.writebytes2.assert_called_once_with(bytearray([0x30 | 0x00]))
+
+
+def test__reset_clears_configuration_register_cache(transceiver):
+    transceiver._spi.xfer2.return_value = [15]
+    transceiver._configuration_register_cache[0x12] = 0b10111110
     transceiver._reset()
-    transceiver._spi.xfer.assert_called_once_with([0x30 | 0x00])
+    assert not transceiver._configuration_register_cache
+
+
+def test__read_configuration_register_uncached(transceiver):
+    transceiver._spi.xfer2.return_value = [15, 0b10111110]
+    assert (
+        transceiver._read_configuration_register(
+            cc1101.addresses.ConfigurationRegisterAddress.MDMCFG2
+        )
+        == 0b10111110
+    )
+    transceiver._spi.xfer2.assert_called_once_with(bytearray([0x12 | 0x80, 0]))
+    assert transceiver._configuration_register_cache[0x12] == 0b10111110
+
+
+def test__read_configuration_register_cached(transceiver):
+    transceiver._configuration_register_cache[0x12] = 0b10011110
+    assert (
+        transceiver._read_configuration_register(
+            cc1101.addresses.ConfigurationRegisterAddress.MDMCFG2
+        )
+        == 0b10011110
+    )
+    transceiver._spi.xfer2.assert_not_called()
+    transceiver._spi.writebytes2.assert_not_called()
+
+
+def test__write_burst_updates_configuration_register_cache(transceiver):
+    transceiver._spi.xfer2.return_value = [15, 15, 15]
+    transceiver._write_burst(
+        start_register=cc1101.addresses.ConfigurationRegisterAddress.SYNC1,
+        values=[0x01, 0xEF],
+    )
+    assert transceiver._configuration_register_cache == {0x04: 0x01, 0x05: 0xEF}
+
+
+def test__write_burst_does_not_cache_fifo(transceiver):
+    transceiver._spi.xfer2.return_value = [15, 15, 15]
+    transceiver._write_burst(
+        start_register=cc1101.addresses.FIFORegisterAddress.TX, values=[21, 42]
+    )
+    assert not transceiver._configuration_register_cache
+
+
+def test__write_configuration_registers_adjacent(transceiver):
+    with unittest.mock.patch.object(transceiver, "_write_burst") as write_burst_mock:
+        transceiver._write_configuration_registers(
+            {
+                cc1101.addresses.ConfigurationRegisterAddress.SYNC1: 0x01,
+                cc1101.addresses.ConfigurationRegisterAddress.SYNC0: 0xEF,
+            }
+        )
+    write_burst_mock.assert_called_once_with(start_register=0x04, values=[0x01, 0xEF])
+
+
+def test__write_configuration_registers_fills_gaps_from_cache(transceiver):
+    transceiver._configuration_register_cache.update({0x05: 0x91, 0x07: 0b100})
+    transceiver._spi.xfer2.return_value = [15, 0x00]  # uncached PKTLEN
+    with unittest.mock.patch.object(transceiver, "_write_burst") as write_burst_mock:
+        transceiver._write_configuration_registers(
+            {
+                cc1101.addresses.ConfigurationRegisterAddress.SYNC1: 0xD3,
+                cc1101.addresses.ConfigurationRegisterAddress.PKTCTRL0: 0b00000101,
+            }
+        )
+    write_burst_mock.assert_called_once_with(
+        start_register=0x04, values=[0xD3, 0x91, 0x00, 0b100, 0b00000101]
+    )
+
+
+def test__prime_configuration_register_cache(transceiver):
+    values = list(range(0x2F))
+    with unittest.mock.patch.object(
+        transceiver, "_read_burst", return_value=values
+    ) as read_burst_mock:
+        transceiver._prime_configuration_register_cache()
+    read_burst_mock.assert_called_once_with(start_register=0x00, length=0x2F)
+    assert transceiver._configuration_register_cache == dict(enumerate(values))
 
 
 @pytest.mark.parametrize("chip_version", [0x14, 0x04])
 def test___enter__(transceiver, chip_version):
     with unittest.mock.patch.object(
-        transceiver, "_read_status_register"
-    ) as read_status_register_mock, unittest.mock.patch.object(
+        transceiver, "_read_partnum_version", return_value=(0, chip_version)
+    ), unittest.mock.patch.object(
         transceiver, "_reset"
     ) as reset_mock, unittest.mock.patch.object(
-        transceiver, "_set_modulation_format"
-    ) as set_modulation_format_mock, unittest.mock.patch.object(
-        transceiver, "_set_power_amplifier_setting_index"
-    ) as set_pa_setting_mock, unittest.mock.patch.object(
-        transceiver, "_disable_data_whitening"
-    ) as disable_whitening_mock, unittest.mock.patch.object(
         transceiver, "_write_burst"
     ) as write_burst_mock, unittest.mock.patch.object(
+        transceiver, "_read_burst", return_value=[0] * 0x2F
+    ) as read_burst_mock, unittest.mock.patch.object(
         transceiver,
         "get_main_radio_control_state_machine_state",
         return_value=cc1101.MainRadioControlStateMachineState.IDLE,
     ):
-        read_status_register_mock.side_effect = lambda r: {
-            cc1101.addresses.StatusRegisterAddress.PARTNUM: 0,
-            cc1101.addresses.StatusRegisterAddress.VERSION: chip_version,
-        }[r]
         with transceiver as transceiver_context:
             assert transceiver == transceiver_context
             transceiver._spi.open.assert_called_once_with(0, 0)
-            assert transceiver._spi.max_speed_hz == 55700
+            assert transceiver._spi.max_speed_hz == 5000000
             assert transceiver._spi.max_speed_hz == transceiver._spi_max_speed_hz
             reset_mock.assert_called_once_with()
-            set_modulation_format_mock.assert_called_once_with(
-                cc1101.options.ModulationFormat.ASK_OOK
-            )
-            set_pa_setting_mock.assert_called_once_with(1)
-            disable_whitening_mock.assert_called_once_with()
+            read_burst_mock.assert_called_once_with(start_register=0x00, length=0x2F)
+            expected_image = [0] * (0x22 - 0x02 + 1)
+            expected_image[0x02 - 0x02] = 0b000001  # IOCFG0
+            expected_image[0x12 - 0x02] = 0b00110000  # MDMCFG2: ASK_OOK
+            expected_image[0x18 - 0x02] = 0b010100  # MCSM0
+            expected_image[0x22 - 0x02] = 0b00000001  # FREND0: PA_POWER index 1
             assert write_burst_mock.call_args_list == [
-                unittest.mock.call(0x18, [0b010100]),
-                unittest.mock.call(0x02, [0b000001]),
+                unittest.mock.call(start_register=0x02, values=expected_image)
             ]
 
 
@@ -116,11 +210,8 @@ def test___enter__spi_max_speed(spi_max_speed_hz):
 
 def test___enter___unsupported_partnum(transceiver):
     with unittest.mock.patch.object(
-        transceiver, "_read_status_register"
-    ) as read_status_register_mock, unittest.mock.patch.object(transceiver, "_reset"):
-        read_status_register_mock.side_effect = lambda r: {
-            cc1101.addresses.StatusRegisterAddress.PARTNUM: 21
-        }[r]
+        transceiver, "_read_partnum_version", return_value=(21, 0x14)
+    ), unittest.mock.patch.object(transceiver, "_reset"):
         with pytest.raises(ValueError, match=r"^unexpected chip part number "):
             with transceiver:
                 pass
@@ -128,12 +219,8 @@ def test___enter___unsupported_partnum(transceiver):
 
 def test___enter___unsupported_chip_version(transceiver):
     with unittest.mock.patch.object(
-        transceiver, "_read_status_register"
-    ) as read_status_register_mock, unittest.mock.patch.object(transceiver, "_reset"):
-        read_status_register_mock.side_effect = lambda r: {
-            cc1101.addresses.StatusRegisterAddress.PARTNUM: 0,
-            cc1101.addresses.StatusRegisterAddress.VERSION: 0x15,
-        }[r]
+        transceiver, "_read_partnum_version", return_value=(0, 0x15)
+    ), unittest.mock.patch.object(transceiver, "_reset"):
         with pytest.raises(
             ValueError,
             match=r"^{}$".format(  # pylint: disable=consider-using-f-string
@@ -148,12 +235,8 @@ def test___enter___unsupported_chip_version(transceiver):
 
 def test___enter___chip_version_zero(transceiver):
     with unittest.mock.patch.object(
-        transceiver, "_read_status_register"
-    ) as read_status_register_mock, unittest.mock.patch.object(transceiver, "_reset"):
-        read_status_register_mock.side_effect = lambda r: {
-            cc1101.addresses.StatusRegisterAddress.PARTNUM: 0x00,
-            cc1101.addresses.StatusRegisterAddress.VERSION: 0x00,
-        }[r]
+        transceiver, "_read_partnum_version", return_value=(0x00, 0x00)
+    ), unittest.mock.patch.object(transceiver, "_reset"):
         with pytest.raises(
             ValueError,
             match=r"^Unsupported chip version 0x00 \(expected one of \[0x04, 0x14\]\)"
@@ -3,6 +3,9 @@ import unittest.mock
 import pytest
 
 import cc1101
+from cc1101.addresses import ConfigurationRegisterAddress
+
+# pylint: disable=protected-access
 
 
 @pytest.mark.parametrize(
@@ -25,35 +28,46 @@ import cc1101
 )
 def test___str___(transceiver_str, sync_word):
     transceiver = cc1101.CC1101()
+    frequency_control_word = cc1101.CC1101._hertz_to_frequency_control_word(433.92e6)
+    (
+        symbol_rate_mantissa,
+        symbol_rate_exponent,
+    ) = cc1101.CC1101._symbol_rate_real_to_floating_point(2142)
+    config = {
+        ConfigurationRegisterAddress.SYNC1: sync_word[0] if sync_word else 0xD3,
+        ConfigurationRegisterAddress.SYNC0: sync_word[1] if sync_word else 0x91,
+        ConfigurationRegisterAddress.PKTLEN: 21,
+        ConfigurationRegisterAddress.PKTCTRL1: 0b00000100,
+        ConfigurationRegisterAddress.PKTCTRL0: cc1101.PacketLengthMode.FIXED,
+        ConfigurationRegisterAddress.ADDR: 0,
+        ConfigurationRegisterAddress.CHANNR: 0,
+        ConfigurationRegisterAddress.FSCTRL1: 0x0F,
+        ConfigurationRegisterAddress.FSCTRL0: 0,
+        ConfigurationRegisterAddress.FREQ2: frequency_control_word[0],
+        ConfigurationRegisterAddress.FREQ1: frequency_control_word[1],
+        ConfigurationRegisterAddress.FREQ0: frequency_control_word[2],
+        ConfigurationRegisterAddress.MDMCFG4: 0b10000000 | symbol_rate_exponent,
+        ConfigurationRegisterAddress.MDMCFG3: symbol_rate_mantissa,
+        ConfigurationRegisterAddress.MDMCFG2: (cc1101.ModulationFormat.ASK_OOK << 4)
+        | (
+            cc1101.SyncMode.TRANSMIT_16_MATCH_15_BITS
+            if sync_word
+            else cc1101.SyncMode.NO_PREAMBLE_AND_SYNC_WORD
+        ),
+        ConfigurationRegisterAddress.MDMCFG1: 0b00100010,  # 4 preamble bytes
+        ConfigurationRegisterAddress.FREND0: 0b00010001,  # PA_POWER index 1
+    }
     with unittest.mock.patch.object(
         transceiver,
         "get_main_radio_control_state_machine_state",
         return_value=cc1101.MainRadioControlStateMachineState.IDLE,
     ), unittest.mock.patch.object(
-        transceiver, "get_base_frequency_hertz", return_value=433.92e6
-    ), unittest.mock.patch.object(
-        transceiver, "get_symbol_rate_baud", return_value=2142
-    ), unittest.mock.patch.object(
-        transceiver,
-        "get_modulation_format",
-        return_value=cc1101.ModulationFormat.ASK_OOK,
-    ), unittest.mock.patch.object(
-        transceiver,
-        "get_sync_mode",
-        return_value=cc1101.SyncMode.TRANSMIT_16_MATCH_15_BITS
-        if sync_word
-        else cc1101.SyncMode.NO_PREAMBLE_AND_SYNC_WORD,
-    ), unittest.mock.patch.object(
-        transceiver, "get_preamble_length_bytes", return_value=4
-    ), unittest.mock.patch.object(
-        transceiver, "get_sync_word", return_value=sync_word
-    ), unittest.mock.patch.object(
-        transceiver,
-        "get_packet_length_mode",
-        return_value=cc1101.PacketLengthMode.FIXED,
-    ), unittest.mock.patch.object(
-        transceiver, "get_packet_length_bytes", return_value=21
-    ), unittest.mock.patch.object(
-        transceiver, "get_output_power", return_value=(0, 0xC0)
+        transceiver, "get_configuration_register_values", return_value=config
+    ) as get_config_mock, unittest.mock.patch.object(
+        transceiver, "_get_patable", return_value=(0, 0xC0, 0, 0, 0, 0, 0, 0)
     ):
         assert str(transceiver) == transceiver_str
+    get_config_mock.assert_called_once_with(
+        start_register=ConfigurationRegisterAddress.SYNC1,
+        end_register=ConfigurationRegisterAddress.FREND0,
+    )